@@ -3,19 +3,113 @@
 Astro ブログ記事をはてなブログ形式に変換するツール
 """
 
+import os
 import re
 import sys
+import json
+import tempfile
+import hashlib
 import argparse
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    # orjson が利用可能ならキャッシュの読み書きにC実装を使用
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    # libyaml が利用可能ならC実装のローダー/ダンパーを使用
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# 変換で使用する正規表現 (モジュール読み込み時に一度だけコンパイル)
+_STRIKE_RE = re.compile(r'~~(.+?)~~')
+_UL_RE = re.compile(r'^- ')
+_OL_RE = re.compile(r'^(\d+)\. ')
+_FENCE_RE = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+_IMG_RE = re.compile(r'<img\s+src="([^"]+)"\s+alt="([^"]*)"[^>]*/?>')
+# ブロック数式 $$...$$ とインライン数式 $...$ を一度の走査で検出
+_MATH_RE = re.compile(r'\$\$(?s:.*?)\$\$|\$[^$]+\$')
+
+# 打ち消し線・コードブロックを一度の走査で変換するための正規表現
+# (画像は打ち消し線の内側やalt属性と入れ子になり得るため別の走査で変換する)
+_FUSED_RE = re.compile(
+    r'(?P<strike>~~(.+?)~~)'
+    r'|(?P<fence>```(\w+)?\n((?s:.*?))```)'
+)
+
+# ファイル入出力のバッファサイズ (大きな記事でもシステムコール回数を抑える)
+_IO_BUFFER_SIZE = 1 << 20
+
+# 変換結果キャッシュのデフォルト保存先
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'astro_hatena'
+
+# 保持するキャッシュの最大件数 (超えた分は古いものから削除する)
+_CACHE_MAX_ENTRIES = 256
+
+# キャッシュキーに含める変換処理の識別子 (初回使用時に _get_cache_salt で作成)
+_CACHE_SALT = None
+
+# リストのネスト階層ごとのインデント文字列
+_INDENTS = tuple('    ' * i for i in range(16))
+
+
+def _indent(depth: int) -> str:
+    """ネスト階層に対応するインデント文字列を取得"""
+    if depth < len(_INDENTS):
+        return _INDENTS[depth]
+    return '    ' * depth
+
+
+def _indent_code(code: str) -> str:
+    """コードの各行に4スペースのインデントを追加"""
+    return '    ' + code.replace('\n', '\n    ')
+
+
+def _get_cache_salt() -> bytes:
+    """変換処理の識別子を取得
+
+    変換器のソースコードとPyYAMLのバージョン・実装から作成し、
+    いずれかが変わると以前のキャッシュが使われなくなるようにする。
+    """
+    global _CACHE_SALT
+    if _CACHE_SALT is None:
+        source_digest = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+        _CACHE_SALT = '\0'.join((source_digest, yaml.__version__, _YamlDumper.__name__)).encode('utf-8')
+    return _CACHE_SALT
+
+
+def _json_loads(data: bytes) -> Any:
+    """UTF-8のJSONバイト列を解析"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """非ASCII文字をそのままUTF-8のJSONバイト列に変換"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _replace_fused(match: re.Match) -> str:
+    """_FUSED_RE にマッチした要素を種類ごとに変換"""
+    if match.lastgroup == 'strike':
+        return '<s>' + match.group(2) + '</s>'
+    return _indent_code(match.group(5))
+
 
 class AstroToHatenaConverter:
     """Astro形式のマークダウンをはてなブログ形式に変換するクラス"""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
         self.warnings = []
+        # 変換結果キャッシュの保存先 (None の場合はキャッシュしない)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
     def convert_frontmatter(self, frontmatter: Dict[str, Any]) -> str:
         """フロントマターを変換"""
@@ -24,76 +118,74 @@ class AstroToHatenaConverter:
             frontmatter['tags'] = ', '.join(frontmatter['tags'])
 
         # YAMLとして出力
-        return yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(frontmatter, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
 
     def convert_strikethrough(self, content: str) -> str:
         """打ち消し線を~~からHTMLタグに変換"""
-        return re.sub(r'~~(.+?)~~', r'<s>\1</s>', content)
+        return _STRIKE_RE.sub(r'<s>\1</s>', content)
 
     def convert_lists(self, content: str) -> str:
         """リストをHTML形式に変換"""
-        lines = content.split('\n')
         result = []
         in_ul = False
         in_ol = False
         indent_level = 0
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        for line in content.split('\n'):
             stripped = line.lstrip()
             current_indent = len(line) - len(stripped)
+            depth = current_indent >> 1
 
             # 順序なしリストの処理
-            if re.match(r'^- ', stripped):
+            if _UL_RE.match(stripped):
                 if not in_ul or current_indent > indent_level:
                     if in_ol:
                         result.append('</ol>')
                         in_ol = False
                     if current_indent > indent_level:
-                        result.append('    ' * (current_indent // 2) + '<ul>')
+                        result.append(_indent(depth) + '<ul>')
                     elif not in_ul:
                         result.append('<ul>')
                     in_ul = True
                     indent_level = current_indent
                 elif current_indent < indent_level:
-                    result.append('    ' * (current_indent // 2) + '</ul>')
+                    result.append(_indent(depth) + '</ul>')
                     indent_level = current_indent
 
                 item_text = stripped[2:]  # "- "を除去
-                result.append('    ' * (current_indent // 2 + 1) + f'<li> {item_text} </li>')
+                result.append(''.join((_indent(depth + 1), '<li> ', item_text, ' </li>')))
+                continue
 
             # 順序ありリストの処理
-            elif re.match(r'^\d+\. ', stripped):
+            match = _OL_RE.match(stripped)
+            if match:
                 if not in_ol or current_indent > indent_level:
                     if in_ul:
                         result.append('</ul>')
                         in_ul = False
                     if current_indent > indent_level:
-                        result.append('    ' * (current_indent // 2) + '<ol>')
+                        result.append(_indent(depth) + '<ol>')
                     elif not in_ol:
                         result.append('<ol>')
                     in_ol = True
                     indent_level = current_indent
                 elif current_indent < indent_level:
-                    result.append('    ' * (current_indent // 2) + '</ol>')
+                    result.append(_indent(depth) + '</ol>')
                     indent_level = current_indent
 
-                item_text = re.sub(r'^\d+\. ', '', stripped)
-                result.append('    ' * (current_indent // 2 + 1) + f'<li> {item_text} </li>')
+                item_text = stripped[match.end():]  # "1. "を除去
+                result.append(''.join((_indent(depth + 1), '<li> ', item_text, ' </li>')))
+                continue
 
-            else:
-                # リストの終了
-                if in_ul:
-                    result.append('</ul>')
-                    in_ul = False
-                if in_ol:
-                    result.append('</ol>')
-                    in_ol = False
-                indent_level = 0
-                result.append(line)
-
-            i += 1
+            # リストの終了
+            if in_ul:
+                result.append('</ul>')
+                in_ul = False
+            if in_ol:
+                result.append('</ol>')
+                in_ol = False
+            indent_level = 0
+            result.append(line)
 
         # 最後にリストが開いていた場合は閉じる
         if in_ul:
@@ -109,11 +201,10 @@ class AstroToHatenaConverter:
             language = match.group(1) if match.group(1) else ''
             code = match.group(2)
             # 各行に4スペースのインデントを追加
-            indented_code = '\n'.join('    ' + line for line in code.split('\n'))
-            return indented_code
+            return _indent_code(code)
 
         # 言語指定ありのコードブロック
-        content = re.sub(r'```(\w+)?\n(.*?)```', replace_code_block, content, flags=re.DOTALL)
+        content = _FENCE_RE.sub(replace_code_block, content)
 
         return content
 
@@ -125,18 +216,17 @@ class AstroToHatenaConverter:
             return f'![{alt}]({src})'
 
         # <img src="..." alt="..." /> 形式を変換
-        content = re.sub(r'<img\s+src="([^"]+)"\s+alt="([^"]*)"[^>]*/?>', replace_img_tag, content)
+        content = _IMG_RE.sub(replace_img_tag, content)
 
         return content
 
     def check_latex_math(self, content: str) -> bool:
         """LaTeX数式が含まれているかチェック"""
-        # インライン数式 $...$
-        inline_math = re.search(r'\$[^$]+\$', content)
-        # ブロック数式 $$...$$
-        block_math = re.search(r'\$\$.*?\$\$', content, re.DOTALL)
+        # '$' を含まなければ正規表現による走査は不要
+        if '$' not in content:
+            return False
 
-        return inline_math is not None or block_math is not None
+        return _MATH_RE.search(content) is not None
 
     def convert_content(self, content: str) -> str:
         """本文の内容を変換"""
@@ -148,10 +238,12 @@ class AstroToHatenaConverter:
             )
 
         # 各種変換を実行
-        content = self.convert_strikethrough(content)
         content = self.convert_lists(content)
-        content = self.convert_code_blocks(content)
-        content = self.convert_images(content)
+        # 打ち消し線・コードブロックは一度の走査でまとめて変換
+        content = _FUSED_RE.sub(_replace_fused, content)
+        # 画像は打ち消し線の変換後に別の走査で変換 (元の変換順序と同じ結果にする)
+        if '<img' in content:
+            content = self.convert_images(content)
 
         return content
 
@@ -159,9 +251,25 @@ class AstroToHatenaConverter:
         """ファイル全体を変換"""
         self.warnings = []  # 警告をリセット
 
-        with open(input_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(input_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            raw = f.read()
+
+        # 内容が変わっていなければ前回の変換結果を使用
+        cache_path = self._get_cache_path(raw)
+        cached = self._load_cache(cache_path)
+        if cached is not None:
+            self.warnings = cached['warnings']
+            return cached['result']
 
+        # テキストモードでの読み込みと同様に改行コードを統一
+        content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        result = self.convert_text(content)
+
+        self._save_cache(cache_path, result)
+        return result
+
+    def convert_text(self, content: str) -> str:
+        """フロントマターを含む記事全体を変換"""
         # フロントマターと本文を分離
         if content.startswith('---\n'):
             parts = content.split('---\n', 2)
@@ -170,7 +278,7 @@ class AstroToHatenaConverter:
                 body = parts[2]
 
                 # フロントマターをパース
-                frontmatter = yaml.safe_load(frontmatter_text)
+                frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
 
                 # 変換実行
                 converted_frontmatter = self.convert_frontmatter(frontmatter)
@@ -187,6 +295,66 @@ class AstroToHatenaConverter:
             # フロントマターがない場合
             return self.convert_content(content)
 
+    def _get_cache_path(self, raw: bytes) -> Optional[Path]:
+        """入力内容のハッシュからキャッシュファイルのパスを取得"""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(_get_cache_salt() + b'\0' + raw).hexdigest()
+        return self.cache_dir / f'{digest}.json'
+
+    def _load_cache(self, cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """キャッシュから変換結果を読み込む"""
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        try:
+            # 使用したキャッシュは更新日時を新しくし、削除対象から外す
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return cached
+
+    def _save_cache(self, cache_path: Optional[Path], result: str):
+        """変換結果をキャッシュに保存"""
+        if cache_path is None:
+            return
+        data = _json_dumps({'result': result, 'warnings': self.warnings})
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # 書き込み途中のファイルが読まれないよう一時ファイルに書き込んでから置き換える
+            # (一時ファイル名は実行ごとに異なるため、並行して保存しても衝突しない)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # キャッシュの保存に失敗しても変換結果は返す
+            print(f"警告: キャッシュの保存に失敗しました: {e}", file=sys.stderr)
+            return
+        self._prune_cache(cache_path.parent)
+
+    def _prune_cache(self, cache_dir: Path):
+        """キャッシュが上限件数を超えた場合、更新日時の古いものから削除"""
+        try:
+            entries = [entry for entry in os.scandir(cache_dir)
+                       if entry.name.endswith('.json') and entry.is_file()]
+            if len(entries) <= _CACHE_MAX_ENTRIES:
+                return
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - _CACHE_MAX_ENTRIES]:
+                os.unlink(entry.path)
+        except OSError:
+            # 他のプロセスが同時に削除した場合などは次回の保存時に再度整理する
+            pass
+
     def get_warnings(self) -> List[str]:
         """変換時の警告を取得"""
         return self.warnings
@@ -198,6 +366,7 @@ def main():
     )
     parser.add_argument('input_file', help='変換する入力ファイル')
     parser.add_argument('--output', '-o', help='出力ファイル（指定なしの場合は標準出力）')
+    parser.add_argument('--no-cache', action='store_true', help='変換結果のキャッシュを使用しない')
 
     args = parser.parse_args()
 
@@ -207,7 +376,7 @@ def main():
         sys.exit(1)
 
     # 変換実行
-    converter = AstroToHatenaConverter()
+    converter = AstroToHatenaConverter(cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
     try:
         result = converter.convert_file(args.input_file)
 
@@ -218,7 +387,7 @@ def main():
 
         # 出力
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
+            with open(args.output, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
                 f.write(result)
             print(f"変換完了: {args.output}")
         else:
@@ -5,22 +5,175 @@ OAuth認証を使用してローカルのMarkdownファイルをはてなブロ
 
 import os
 import sys
+import copy
+import tempfile
 import argparse
 import json
+try:
+    # orjson が利用可能ならC実装のJSONエンコーダ/デコーダを使用
+    import orjson
+except ImportError:
+    orjson = None
 import yaml
+try:
+    # libyaml が利用可能ならC実装のローダーを使用
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+from functools import lru_cache
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
+try:
+    # lxml が利用可能ならAtomPubエントリの構築・レスポンス解析にC実装を使用
+    from lxml import etree as LET
+    _HAVE_LXML = True
+except ImportError:
+    LET = ET
+    _HAVE_LXML = False
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import mistune
+from requests.adapters import HTTPAdapter
 import re
-import urllib.parse
-import webbrowser
-from requests_oauthlib import OAuth1Session
-from dateutil import parser as date_parser
-import pytz
-import mimetypes
-import base64
+from requests_oauthlib import OAuth1, OAuth1Session
+try:
+    # ciso8601 が利用可能ならISO 8601形式の日時をC実装で解析
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+
+# 記事ファイル読み込み時のバッファサイズ
+_IO_BUFFER_SIZE = 1 << 20
+
+# AtomPub の名前空間
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+APP_NS = 'http://www.w3.org/2007/app'
+_ATOM = f'{{{ATOM_NS}}}'
+_APP = f'{{{APP_NS}}}'
+if not _HAVE_LXML:
+    # 標準ライブラリでは接頭辞をグローバルに登録してシリアライズ時に使用
+    ET.register_namespace('', ATOM_NS)
+    ET.register_namespace('app', APP_NS)
+
+# 日本標準時 (夏時間がないため固定オフセットで扱う)
+JST = timezone(timedelta(hours=9))
+
+# はてなブログ向けコードブロック変換用の正規表現
+# (言語指定あり・なしの両方を一度の走査で処理する)
+_CODE_BLOCK_RE = re.compile(r'<pre><code(?: class="language-\w+")?>(.*?)</code></pre>', re.DOTALL)
+
+# Markdown変換結果のキャッシュ件数
+_MD_CACHE_SIZE = 64
+
+# はてなフォトライフのレスポンスに含まれる画像URL要素 {タグ名: サイズ}
+HATENA_NS = 'http://www.hatena.ne.jp/info/xmlns#'
+_IMAGEURL_TAGS = {
+    f'{{{HATENA_NS}}}imageurl': 'original',
+    f'{{{HATENA_NS}}}imageurlmedium': 'medium',
+    f'{{{HATENA_NS}}}imageurlsmall': 'small',
+}
+
+# はてなフォトライフ用XMLエントリの固定部分
+# (タイトル・MIMEタイプ・Base64データの間に挟み込んで使用する)
+_FOTOLIFE_ENTRY_HEAD = (
+    b'<?xml version="1.0" encoding="utf-8"?>\n'
+    b'<entry xmlns="http://www.w3.org/2005/Atom">\n'
+    b'    <title>'
+)
+_FOTOLIFE_ENTRY_TYPE = b'</title>\n    <content mode="base64" type="'
+_FOTOLIFE_ENTRY_CONTENT = b'">'
+_FOTOLIFE_ENTRY_TAIL = b'</content>\n</entry>'
+
+# 複数ファイルを並列アップロードする際の最大スレッド数
+MAX_UPLOAD_WORKERS = 8
+
+# アップロード可能な画像の拡張子とMIMEタイプ
+_IMAGE_MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.jpe': 'image/jpeg',
+    '.png': 'image/png',
+}
+
+# 画像をBase64エンコードする際の読み込み単位 (3の倍数)
+_B64_CHUNK_SIZE = 57 * 1024
+
+# Markdownレンダラー (初回変換時に一度だけ生成して使い回す)
+_MARKDOWN_RENDERER = None
+
+# 読み込み済み設定ファイルのキャッシュ {絶対パス: ((mtime_ns, size), 設定)}
+_CONFIG_CACHE = {}
+
+
+def _json_loads(data):
+    """JSON文字列 (またはUTF-8バイト列) を解析"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """2スペースインデント・非ASCII文字そのままでJSON文字列に変換"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _get_markdown_renderer():
+    """Markdownレンダラーを取得 (mistuneは変換が必要な場合のみインポートする)"""
+    global _MARKDOWN_RENDERER
+    if _MARKDOWN_RENDERER is None:
+        import mistune
+        _MARKDOWN_RENDERER = mistune.create_markdown(
+            escape=False,
+            plugins=['strikethrough', 'footnotes', 'table'],
+        )
+    return _MARKDOWN_RENDERER
+
+
+def _parse_datetime_string(text):
+    """日時文字列を解析 (ISO 8601形式以外は dateutil で解析する)"""
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(text)
+        except ValueError:
+            pass
+    # dateutil は ISO 8601 以外の形式を解析する場合のみインポートする
+    from dateutil import parser as date_parser
+    return date_parser.parse(text)
+
+
+@lru_cache(maxsize=_MD_CACHE_SIZE)
+def _render_markdown(markdown_content, hatena):
+    """MarkdownをHTMLに変換 (同じ内容の変換結果はキャッシュから返す)"""
+    # 基本的なMarkdown to HTML変換
+    html = _get_markdown_renderer()(markdown_content)
+
+    # はてなブログ特有の変換
+    if hatena:
+        # コードブロックをはてな記法に変換
+        html = _CODE_BLOCK_RE.sub(r'<blockquote>\n\1\n</blockquote>', html)
+
+    return html
+
+
+def _config_file_key(path):
+    """設定ファイルの変更検出に使うキー (更新日時[ns], サイズ) を取得"""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _coerce_list(value):
+    """フロントマターの値 (リスト・カンマ区切り文字列・None) をリストに正規化"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value if item is not None]
+    return [str(value)]
 
 
 class HatenaBlogOAuthUploader:
@@ -40,6 +193,10 @@ class HatenaBlogOAuthUploader:
         # 画像アップロード用エンドポイント（はてなフォトライフ用）
         self.image_upload_url = f"https://f.hatena.ne.jp/atom/post/{self.hatena_id}"
 
+        # API呼び出し用のHTTPセッションと署名用の認証オブジェクト (初回使用時に作成)
+        self._http_session = None
+        self._signed_auth = None
+
     def _resolve_config_path(self, config_file):
         """設定ファイルのパスを解決する (将来拡張用)"""
         config_path = config_file
@@ -53,8 +210,15 @@ class HatenaBlogOAuthUploader:
             print("OAuth認証情報を設定してください。")
             sys.exit(1)
 
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # 前回読み込み時からファイルが変更されていなければキャッシュを使用
+        config_path = os.path.abspath(self.config_file)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached and cached[0] == _config_file_key(config_path):
+            self.config = copy.deepcopy(cached[1])
+        else:
+            with open(self.config_file, 'rb') as f:
+                self.config = _json_loads(f.read())
+            self._update_config_cache()
 
         try:
             oauth_config = self.config['oauth']
@@ -71,6 +235,11 @@ class HatenaBlogOAuthUploader:
             print(f"設定ファイルに {e} が設定されていません。")
             sys.exit(1)
 
+    def _update_config_cache(self):
+        """現在の設定内容をキャッシュに登録"""
+        config_path = os.path.abspath(self.config_file)
+        _CONFIG_CACHE[config_path] = (_config_file_key(config_path), copy.deepcopy(self.config))
+
     def create_config(self):
         """設定ファイルを作成"""
         self.config = {
@@ -84,19 +253,58 @@ class HatenaBlogOAuthUploader:
             }
         }
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        self._write_config()
+
+    def _write_config(self):
+        """設定内容をファイルに書き込む"""
+        # 一度に文字列化して1回の write() で書き込む
+        data = _json_dumps(self.config)
+        # 同じディレクトリの一時ファイルに書き込んでから置き換え、書き込み途中の状態を読まれないようにする
+        # (一時ファイル名は実行ごとに異なるため、並行して保存しても衝突しない)
+        config_dir = os.path.dirname(os.path.abspath(self.config_file))
+        fd, tmp_file = tempfile.mkstemp(dir=config_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+        # 書き込んだ内容をキャッシュに反映し、次回の読み込みを省略する
+        self._update_config_cache()
 
     def save_access_token(self, access_token, access_token_secret):
         """アクセストークンを設定ファイルに保存"""
         self.config['oauth']['access_token'] = access_token
         self.config['oauth']['access_token_secret'] = access_token_secret
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        self._write_config()
 
         self.access_token = access_token
         self.access_token_secret = access_token_secret
+        # トークンが変わったため署名用の認証オブジェクトを作り直す
+        self._signed_auth = None
+
+    @property
+    def _session(self):
+        """API呼び出し用のHTTPセッション (接続を使い回してTLSハンドシェイクを省く)"""
+        if self._http_session is None:
+            session = requests.Session()
+            # 並列アップロード時も接続を破棄せず再利用できるよう、ホストごとの接続数をスレッド数に合わせる
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_UPLOAD_WORKERS))
+            self._http_session = session
+        return self._http_session
+
+    def _oauth_auth(self):
+        """アクセストークンでリクエストに署名するOAuth認証オブジェクトを取得"""
+        if self._signed_auth is None:
+            self._signed_auth = OAuth1(
+                client_key=self.consumer_key,
+                client_secret=self.consumer_secret,
+                resource_owner_key=self.access_token,
+                resource_owner_secret=self.access_token_secret
+            )
+        return self._signed_auth
 
     def authenticate(self):
         """OAuth認証を実行"""
@@ -131,8 +339,9 @@ class HatenaBlogOAuthUploader:
         print(f"{authorization_url}")
         print("\n認証後に表示される認証コード（PIN）を入力してください。")
 
-        # ブラウザを自動で開く
+        # ブラウザを自動で開く (認証時のみ必要なため、ここでインポートする)
         try:
+            import webbrowser
             webbrowser.open(authorization_url)
         except:
             pass
@@ -176,15 +385,18 @@ class HatenaBlogOAuthUploader:
         front_matter = {}
 
         # YAML front matter の解析
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                front_matter_text = parts[1].strip()
-                content = parts[2].strip()
+        if content.startswith(('---\n', '---\r\n')):
+            # 本文全体を分割せず、終了側の区切り位置だけを探す
+            end = content.find('\n---', 3)
+            if end != -1:
+                front_matter_text = content[3:end].strip()
+                # 本文は終了側の区切り行の次の行から
+                body_start = content.find('\n', end + 4)
+                content = content[body_start + 1:].strip() if body_start != -1 else ''
 
                 try:
                     # PyYAMLを使用してYAMLを解析
-                    front_matter = yaml.safe_load(front_matter_text)
+                    front_matter = yaml.load(front_matter_text, Loader=_YamlLoader)
 
                     # front_matterがNoneの場合は空の辞書を設定
                     if front_matter is None:
@@ -203,13 +415,19 @@ class HatenaBlogOAuthUploader:
             return None
 
         try:
-            # 様々な日付フォーマットを解析
-            parsed_date = date_parser.parse(date_string)
+            if isinstance(date_string, datetime):
+                # YAMLで日時として解析済みの場合
+                parsed_date = date_string
+            elif isinstance(date_string, date):
+                # YAMLで日付として解析済みの場合
+                parsed_date = datetime(date_string.year, date_string.month, date_string.day)
+            else:
+                # 様々な日付フォーマットを解析
+                parsed_date = _parse_datetime_string(str(date_string))
 
             # タイムゾーンが設定されていない場合はJSTを設定
             if parsed_date.tzinfo is None:
-                jst = pytz.timezone('Asia/Tokyo')
-                parsed_date = jst.localize(parsed_date)
+                parsed_date = parsed_date.replace(tzinfo=JST)
 
             # ISO 8601形式で返す
             return parsed_date.isoformat()
@@ -219,28 +437,12 @@ class HatenaBlogOAuthUploader:
 
     def markdown_to_html(self, markdown_content, hatena=False):
         """MarkdownをはてなブログHTML形式に変換"""
-        # 基本的なMarkdown to HTML変換
-        html = mistune.html(markdown_content)
-
-        # はてなブログ特有の変換
-        if hatena:
-            # コードブロックをはてな記法に変換
-            html = re.sub(
-                r'<pre><code class="language-(\w+)">(.*?)</code></pre>',
-                r'<blockquote>\n\2\n</blockquote>',
-                html,
-                flags=re.DOTALL
-            )
-
-            # 通常のコードブロック
-            html = re.sub(
-                r'<pre><code>(.*?)</code></pre>',
-                r'<blockquote>\n\1\n</blockquote>',
-                html,
-                flags=re.DOTALL
-            )
+        # 空白のみの本文は変換結果も空になるため、レンダラーを通さない
+        if not markdown_content.strip():
+            return ''
 
-        return html
+        # 同じ内容の変換結果があれば再利用
+        return _render_markdown(markdown_content, hatena)
 
     def create_atom_entry(self,
             title,
@@ -253,55 +455,57 @@ class HatenaBlogOAuthUploader:
             summary=None,
             ):
 
-        """AtomPub用のXMLエントリを作成"""
-        entry = ET.Element('entry')
-        entry.set('xmlns', 'http://www.w3.org/2005/Atom')
-        entry.set('xmlns:app', 'http://www.w3.org/2007/app')
+        """AtomPub用のXMLエントリを作成 (UTF-8のバイト列を返す)"""
+        if _HAVE_LXML:
+            entry = LET.Element(_ATOM + 'entry', nsmap={None: ATOM_NS, 'app': APP_NS})
+        else:
+            entry = LET.Element(_ATOM + 'entry')
 
         # タイトル
-        title_elem = ET.SubElement(entry, 'title')
+        title_elem = LET.SubElement(entry, _ATOM + 'title')
         title_elem.text = title
 
         # 投稿者
         if author:
-            author_elem = ET.SubElement(entry, 'author')
-            name_elem = ET.SubElement(author_elem, 'name')
+            author_elem = LET.SubElement(entry, _ATOM + 'author')
+            name_elem = LET.SubElement(author_elem, _ATOM + 'name')
             name_elem.text = author
 
         # 要約
         if summary:
-            summary_elem = ET.SubElement(entry, 'summary')
+            summary_elem = LET.SubElement(entry, _ATOM + 'summary')
             summary_elem.text = summary
 
         # 本文
-        content_elem = ET.SubElement(entry, 'content')
+        content_elem = LET.SubElement(entry, _ATOM + 'content')
         content_elem.set('type', 'text/html')
         content_elem.text = content
 
         # 公開日時
         if published_date:
-            published_elem = ET.SubElement(entry, 'published')
+            published_elem = LET.SubElement(entry, _ATOM + 'published')
             published_elem.text = published_date
 
         # 更新日時
         if updated_date:
-            updated_elem = ET.SubElement(entry, 'updated')
+            updated_elem = LET.SubElement(entry, _ATOM + 'updated')
             updated_elem.text = updated_date
 
         # カテゴリ
         if categories:
             for category in categories:
-                category_elem = ET.SubElement(entry, 'category')
+                category_elem = LET.SubElement(entry, _ATOM + 'category')
                 category_value = category.strip()
                 category_elem.set('term', category_value)
 
         # 下書き設定
         if draft:
-            control = ET.SubElement(entry, 'app:control')
-            draft_elem = ET.SubElement(control, 'app:draft')
+            control = LET.SubElement(entry, _APP + 'control')
+            draft_elem = LET.SubElement(control, _APP + 'draft')
             draft_elem.text = 'yes'
 
-        return ET.tostring(entry, encoding='unicode')
+        # 送信用にUTF-8のバイト列として直接シリアライズ
+        return LET.tostring(entry, encoding='utf-8', xml_declaration=True)
 
     def upload_entry(self,
             title,
@@ -312,9 +516,14 @@ class HatenaBlogOAuthUploader:
             updated_date=None,
             author=None,
             summary=None,
-            preview=False):
+            preview=False,
+            quiet=False):
 
-        """エントリをはてなブログにアップロード"""
+        """エントリをはてなブログにアップロード
+
+        成功時は投稿したエントリのURL (Locationヘッダー) を返す。
+        quiet=True の場合は成功時のメッセージを表示しない。
+        """
         if not self.access_token or not self.access_token_secret:
             print("認証が必要です。先に authenticate() を実行してください。")
             return False
@@ -332,30 +541,25 @@ class HatenaBlogOAuthUploader:
         if preview:
             return True
 
-        # OAuth認証セッションを作成
-        oauth = OAuth1Session(
-            client_key=self.consumer_key,
-            client_secret=self.consumer_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret
-        )
-
         headers = {
             'Content-Type': 'application/atom+xml; charset=utf-8'
         }
 
         try:
-            response = oauth.post(
+            response = self._session.post(
                 self.api_url,
-                data=atom_entry.encode('utf-8'),
-                headers=headers
+                data=atom_entry,
+                headers=headers,
+                auth=self._oauth_auth()
             )
 
             if response.status_code == 201:
                 # 投稿成功
                 location = response.headers.get('Location', '')
-                print(f"投稿が完了しました: {location}")
-                return True
+                if not quiet:
+                    print(f"投稿が完了しました: {location}")
+                # Locationヘッダーがない場合も成功として扱う
+                return location or True
             else:
                 print(f"投稿に失敗しました: {response.status_code}")
                 print(f"エラー内容: {response.text}")
@@ -371,15 +575,15 @@ class HatenaBlogOAuthUploader:
             print(f"通信エラー: {e}")
             return False
 
-    def upload_file(self, file_path, draft=False, preview=False):
-        """Markdownファイルをアップロード"""
+    def upload_file(self, file_path, draft=False, preview=False, quiet=False):
+        """Markdownファイルをアップロード (quiet=True の場合は記事情報を表示しない)"""
         file_path = Path(file_path)
 
         if not file_path.exists():
             print(f"ファイルが見つかりません: {file_path}")
             return False
 
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
             content = f.read()
 
         # フロントマターを解析
@@ -391,9 +595,9 @@ class HatenaBlogOAuthUploader:
         # カテゴリを取得
         categories = []
         if 'categories' in front_matter:
-            categories = front_matter['categories']
+            categories = _coerce_list(front_matter['categories'])
         elif 'tags' in front_matter:
-            categories = front_matter['tags']
+            categories = _coerce_list(front_matter['tags'])
 
         # 下書き設定
         is_draft = front_matter.get('draft', False)
@@ -421,19 +625,20 @@ class HatenaBlogOAuthUploader:
         # Markdownをはてなブログ形式に変換
         html_content = self.markdown_to_html(markdown_content, hatena=False)
 
-        print(f"認証方式: OAuth")
-        print(f"タイトル: {title}")
-        print(f"カテゴリ: {', '.join(categories) if categories else 'なし'}")
-        print(f"下書き: {'はい' if is_draft else 'いいえ'}")
-        if author:
-            print(f"投稿者: {author}")
-        if summary:
-            print(f"要約: {summary}")
-        if published_date:
-            print(f"公開日時: {published_date}")
-        if updated_date:
-            print(f"更新日時: {updated_date}")
-        print()
+        if not quiet:
+            print(f"認証方式: OAuth")
+            print(f"タイトル: {title}")
+            print(f"カテゴリ: {', '.join(categories) if categories else 'なし'}")
+            print(f"下書き: {'はい' if is_draft else 'いいえ'}")
+            if author:
+                print(f"投稿者: {author}")
+            if summary:
+                print(f"要約: {summary}")
+            if published_date:
+                print(f"公開日時: {published_date}")
+            if updated_date:
+                print(f"更新日時: {updated_date}")
+            print()
 
         # プレビュー
         if preview:
@@ -449,11 +654,12 @@ class HatenaBlogOAuthUploader:
             updated_date,
             author,
             summary,
-            preview=preview)
+            preview=preview,
+            quiet=quiet)
 
 
-    def upload_image(self, image_path, verbose=False, output_file=None):
-        """画像をはてなフォトライフにアップロード"""
+    def upload_image(self, image_path, verbose=False, output_file=None, quiet=False):
+        """画像をはてなフォトライフにアップロード (quiet=True の場合は結果を表示しない)"""
         image_path = Path(image_path)
 
         # ファイル存在確認
@@ -461,54 +667,50 @@ class HatenaBlogOAuthUploader:
             print(f"画像ファイルが見つかりません: {image_path}")
             return None
 
-        # MIMEタイプチェック
-        mime_type, _ = mimetypes.guess_type(str(image_path))
+        # MIMEタイプチェック (jpg, png のみ許可)
+        mime_type = _IMAGE_MIME_TYPES.get(image_path.suffix.lower())
         if not mime_type:
-            print(f"MIMEタイプを判定できません: {image_path}")
+            print(f"サポートされていない画像形式です: {image_path} (jpg, png のみ対応)")
             return None
         if verbose:
             print(f'MIME type = {mime_type}')
 
-        # 画像ファイルチェック (jpg, png のみ許可)
-        if not mime_type.startswith('image/'):
-            print(f"画像ファイルではありません: {image_path} (MIME: {mime_type})")
-            return None
-
-        # jpg, png のみ許可
-        if mime_type not in ['image/jpeg', 'image/png']:
-            print(f"サポートされていない画像形式です: {mime_type} (jpg, png のみ対応)")
-            return None
-
         # 認証チェック
         if not self.access_token or not self.access_token_secret:
             print("認証が必要です。先に authenticate() を実行してください。")
             return None
 
-        # 画像ファイルを読み込み
+        try:
+            # pybase64 が利用可能ならSIMD実装のBase64エンコーダを使用
+            import pybase64 as base64
+        except ImportError:
+            import base64
+
+        # 画像ファイルを読み込みながらBase64エンコード
+        # (3の倍数バイト単位でエンコードすれば連結結果は一括エンコードと一致する)
+        encoded_image = bytearray()
         try:
             with open(image_path, 'rb') as f:
-                image_data = f.read()
+                while True:
+                    chunk = f.read(_B64_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    encoded_image += base64.b64encode(chunk)
         except Exception as e:
             print(f"画像ファイルの読み込みに失敗しました: {e}")
             return None
 
-        # Base64エンコード
-        encoded_image = base64.b64encode(image_data).decode('utf-8')
-
-        # はてなフォトライフ用のXMLエントリを作成
-        entry_xml = f'''<?xml version="1.0" encoding="utf-8"?>
-<entry xmlns="http://www.w3.org/2005/Atom">
-    <title>{image_path.name}</title>
-    <content mode="base64" type="{mime_type}">{encoded_image}</content>
-</entry>'''
-
-        # OAuth認証セッションを作成
-        oauth = OAuth1Session(
-            client_key=self.consumer_key,
-            client_secret=self.consumer_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret
-        )
+        # はてなフォトライフ用のXMLエントリをバイト列として直接作成
+        # (画像データのコピーが1回で済むよう join で連結する)
+        entry_xml = b''.join((
+            _FOTOLIFE_ENTRY_HEAD,
+            xml_escape(image_path.name).encode('utf-8'),
+            _FOTOLIFE_ENTRY_TYPE,
+            mime_type.encode('ascii'),
+            _FOTOLIFE_ENTRY_CONTENT,
+            encoded_image,
+            _FOTOLIFE_ENTRY_TAIL,
+        ))
 
         # ヘッダーの設定
         headers = {
@@ -516,10 +718,11 @@ class HatenaBlogOAuthUploader:
         }
 
         try:
-            response = oauth.post(
+            response = self._session.post(
                 self.image_upload_url,
-                data=entry_xml.encode('utf-8'),
-                headers=headers
+                data=entry_xml,
+                headers=headers,
+                auth=self._oauth_auth()
             )
 
             if response.status_code == 201:
@@ -531,23 +734,29 @@ class HatenaBlogOAuthUploader:
 
                 # XMLレスポンスを解析して画像URLを取得
                 try:
-                    root = ET.fromstring(response.text)
+                    # 本文をデコードせずバイト列のまま解析する
+                    root = LET.fromstring(response.content)
 
+                    # 各サイズの画像URLを一度の走査でまとめて取得
+                    # (verbose時は同じ走査の中でXMLの構造も表示する)
+                    image_urls = {}
                     if verbose:
-                        # デバッグ用: XMLの構造を表示
                         print("=== XMLの構造解析 ===")
-                        for elem in root.iter():
+                        elems = root.iter()
+                    elif _HAVE_LXML:
+                        # lxml では対象タグの絞り込みをC実装の走査で行う
+                        elems = root.iter(*_IMAGEURL_TAGS)
+                    else:
+                        elems = root.iter()
+                    for elem in elems:
+                        if verbose:
                             print(f"要素: {elem.tag}, 属性: {elem.attrib}, テキスト: {elem.text}")
+                        size = _IMAGEURL_TAGS.get(elem.tag)
+                        if size and size not in image_urls:
+                            image_urls[size] = elem.text
+                    if verbose:
                         print("=== 構造解析終了 ===\n")
 
-                    # はてな独自の名前空間から画像URLを取得
-                    hatena_ns = 'http://www.hatena.ne.jp/info/xmlns#'
-
-                    # 各サイズの画像URLを取得
-                    imageurl_elem = root.find(f'.//{{{hatena_ns}}}imageurl')
-                    imageurl_medium_elem = root.find(f'.//{{{hatena_ns}}}imageurlmedium')
-                    imageurl_small_elem = root.find(f'.//{{{hatena_ns}}}imageurlsmall')
-
                     # 結果データを集約
                     result_data = {
                         "success": True,
@@ -555,17 +764,15 @@ class HatenaBlogOAuthUploader:
                         "urls": {}
                     }
 
-                    if imageurl_elem is not None and imageurl_elem.text:
-                        original_url = imageurl_elem.text
+                    original_url = image_urls.get('original')
+                    if original_url:
                         result_data["urls"]["original"] = original_url
 
-                        if imageurl_medium_elem is not None and imageurl_medium_elem.text:
-                            medium_url = imageurl_medium_elem.text
-                            result_data["urls"]["medium"] = medium_url
+                        if image_urls.get('medium'):
+                            result_data["urls"]["medium"] = image_urls['medium']
 
-                        if imageurl_small_elem is not None and imageurl_small_elem.text:
-                            small_url = imageurl_small_elem.text
-                            result_data["urls"]["small"] = small_url
+                        if image_urls.get('small'):
+                            result_data["urls"]["small"] = image_urls['small']
 
                         result_data["html_tag"] = f'<img src="{original_url}" alt="{image_path.name}">'
 
@@ -573,9 +780,9 @@ class HatenaBlogOAuthUploader:
                         if output_file:
                             # JSONファイルに保存
                             with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(result_data, f, indent=2, ensure_ascii=False)
+                                f.write(_json_dumps(result_data))
                             print(f"結果を{output_file}に保存しました")
-                        else:
+                        elif not quiet:
                             # 標準出力に表示
                             print("=== 画像アップロード完了 ===")
                             print(f"オリジナル画像URL: {original_url}")
@@ -596,25 +803,28 @@ class HatenaBlogOAuthUploader:
                         content_elem = root.find('.//{http://www.w3.org/2005/Atom}content')
                         if content_elem is not None and 'src' in content_elem.attrib:
                             image_url = content_elem.attrib['src']
-                            print(f"画像のアップロードが完了しました: {image_url}")
+                            if not quiet:
+                                print(f"画像のアップロードが完了しました: {image_url}")
                             return image_url
                         else:
                             # alternativeとしてlink要素を確認
                             link_elem = root.find('.//{http://www.w3.org/2005/Atom}link[@rel="edit-media"]')
                             if link_elem is not None and 'href' in link_elem.attrib:
                                 edit_url = link_elem.attrib['href']
-                                print(f"画像のアップロードが完了しました: {edit_url}")
+                                if not quiet:
+                                    print(f"画像のアップロードが完了しました: {edit_url}")
                                 return edit_url
                             else:
                                 # location headerから取得を試行
                                 location = response.headers.get('Location', '')
                                 if location:
-                                    print(f"画像のアップロードが完了しました: {location}")
+                                    if not quiet:
+                                        print(f"画像のアップロードが完了しました: {location}")
                                     return location
                                 else:
                                     print("XMLレスポンスから画像URLを取得できませんでした")
                                     return None
-                except ET.ParseError as e:
+                except LET.ParseError as e:
                     print(f"XMLレスポンスの解析に失敗しました: {e}")
                     print(f"レスポンス: {response.text}")
                     return None
@@ -633,14 +843,61 @@ class HatenaBlogOAuthUploader:
             print(f"通信エラー: {e}")
             return None
 
+def upload_files(uploader, args):
+    """複数のファイルをスレッドプールで並列にアップロード"""
+    if args.output:
+        print("--output は1つのファイルを指定した場合のみ使用できます。")
+        sys.exit(1)
+
+    # プレビュー・詳細表示は出力が混ざらないよう順番に処理し、各ファイルの出力をそのまま表示する
+    sequential = args.preview or args.verbose
+
+    def upload(file_path):
+        # 1つのファイルの例外で一括処理全体が中断されないよう、例外は結果として返す
+        # (中断すると投稿済みのURLが表示されず、再実行で二重投稿になる)
+        try:
+            if args.image:
+                return uploader.upload_image(file_path, args.verbose, quiet=not sequential)
+            return uploader.upload_file(file_path, draft=args.draft, preview=args.preview, quiet=not sequential)
+        except Exception as e:
+            return e
+
+    # 通信待ちが大半を占めるため、スレッドで並列化して共有セッションの接続を使い回す
+    # (並列時は各スレッドでは結果を表示せず、ファイルごとの結果をまとめて表示する)
+    max_workers = 1 if sequential else min(MAX_UPLOAD_WORKERS, len(args.file))
+    # セッションと認証オブジェクトは並列処理の開始前に作成しておく
+    # (各スレッドが同時に初回作成すると、別々の接続プールが作られて接続を使い回せない)
+    uploader._session
+    uploader._oauth_auth()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(upload, args.file))
+
+    failed = []
+    for file_path, result in zip(args.file, results):
+        if isinstance(result, Exception):
+            print(f"{file_path}: {result}")
+            failed.append(file_path)
+        elif not result:
+            failed.append(file_path)
+        elif isinstance(result, str):
+            print(f"{file_path}: {result}")
+        else:
+            print(f"{file_path}: 完了")
+    print(f"アップロード完了: {len(results) - len(failed)}/{len(results)} 件")
+    if failed:
+        for file_path in failed:
+            print(f"失敗: {file_path}")
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='はてなブログOAuth投稿ツール'
     )
     parser.add_argument(
         'file',
-        nargs='?',
-        help='投稿するMarkdownファイルのパス'
+        nargs='*',
+        help='投稿するMarkdownファイルのパス（複数指定可）'
     )
     parser.add_argument(
         '--preview',
@@ -698,10 +955,17 @@ def main():
         print("認証のみを行う場合は --auth-only オプションを使用してください。")
         sys.exit(1)
 
+    # 複数ファイルの場合は並列にアップロード
+    if len(args.file) > 1:
+        upload_files(uploader, args)
+        return
+
+    file_path = args.file[0]
+
     # 画像アップロードまたはブログ投稿の分岐処理
     if args.image:
         # 画像アップロード
-        image_url = uploader.upload_image(args.file, args.verbose, args.output)
+        image_url = uploader.upload_image(file_path, args.verbose, args.output)
         if image_url:
             if not args.output:  # 標準出力の場合のみ表示
                 print(f"画像アップロードが完了しました！")
@@ -711,7 +975,7 @@ def main():
     else:
         # ブログ投稿
         success = uploader.upload_file(
-            args.file,
+            file_path,
             draft=args.draft,
             preview=args.preview)
         if success: